@@ -1,15 +1,24 @@
-from cubexpress.conversion import lonlat2rt
-from cubexpress.download import getcube, getGeoTIFF
-from cubexpress.geotyping import RasterTransform, Request, RequestSet
+from cubexpress.conversion import lonlat2epsg, lonlat2rt, lonlat2rt_batch
+from cubexpress.download import getcube, getGeoTIFF, initialize_high_volume
+from cubexpress.geotyping import (
+    RasterTransform,
+    RasterTransformBatch,
+    Request,
+    RequestSet,
+)
 
 # Export the functions
 __all__ = [
     "lonlat2rt",
+    "lonlat2rt_batch",
+    "lonlat2epsg",
     "RasterTransform",
+    "RasterTransformBatch",
     "Request",
     "RequestSet",
     "getcube",
     "getGeoTIFF",
+    "initialize_high_volume",
 ]
 
 # Dynamic version import
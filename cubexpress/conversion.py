@@ -1,28 +1,208 @@
-import utm
+import math
+from functools import lru_cache
 
-from cubexpress.geotyping import RasterTransform
+import numpy as np
+from pyproj import Transformer
+
+from cubexpress.geotyping import NumberType, RasterTransform, RasterTransformBatch
 
 # Define your GeotransformDict type if not already defined
 GeotransformDict = dict[str, float]
 
 
+# EPSG codes of the 120 UTM zones: north zones 1-60, then south zones 1-60
+_UTM_EPSG: tuple[str, ...] = tuple(
+    f"EPSG:{hemisphere}{zone:02d}" for hemisphere in (326, 327) for zone in range(1, 61)
+)
+
+
+def _zone_epsg(zone: int, north: bool) -> str:
+    """Returns the ``"EPSG:XYZ"`` code of a UTM zone from the precomputed table."""
+    return _UTM_EPSG[zone - 1 if north else zone + 59]
+
+
 def geo2utm(lon: float, lat: float) -> tuple[float, float, str]:
     """
     Converts latitude and longitude coordinates to UTM coordinates and returns the EPSG code.
 
+    The zone is derived analytically with :func:`lonlat2epsg` and the projection reuses one
+    cached transformer per zone, so points over the same area only pay the PROJ setup once.
+
     Args:
         lon (float): Longitude.
         lat (float): Latitude.
 
     Returns:
         Tuple[float, float, str]: UTM coordinates (x, y) and the EPSG code.
+
+    Raises:
+        ValueError: If the point is outside the latitude or longitude range covered by UTM.
+    """
+    epsg = lonlat2epsg(lon, lat)  # Also validates the coordinates
+    x, y = _utm_transformer(epsg).transform(lon, lat)
+    return x, y, epsg
+
+
+def utm_zones(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """
+    Vectorized UTM zone number lookup, following the same rules as :func:`lonlat2epsg`.
+
+    Args:
+        lon (np.ndarray): Longitudes.
+        lat (np.ndarray): Latitudes.
+
+    Returns:
+        np.ndarray: The UTM zone number (1-60) of every point.
+    """
+    lon = (lon + 180) % 360 - 180
+    zones = ((lon + 180) // 6).astype(np.int64) + 1
+
+    # Standard UTM zone exceptions: south-western Norway and Svalbard
+    norway = (lat >= 56) & (lat < 64) & (lon >= 3) & (lon < 12)
+    svalbard = (lat >= 72) & (lat <= 84) & (lon >= 0)
+    return np.select(
+        [
+            norway,
+            svalbard & (lon < 9),
+            svalbard & (lon < 21),
+            svalbard & (lon < 33),
+            svalbard & (lon < 42),
+        ],
+        [32, 31, 33, 35, 37],
+        default=zones,
+    )
+
+
+@lru_cache(maxsize=128)
+def _utm_transformer(epsg: str) -> Transformer:
+    """Get cached transformer from WGS84 (EPSG:4326) to a UTM zone"""
+    return Transformer.from_crs("EPSG:4326", epsg, always_xy=True)
+
+
+def geo2utm_batch(
+    lon: np.ndarray, lat: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """
+    Vectorized version of :func:`geo2utm` for arrays of points.
+
+    Points are grouped by UTM zone and hemisphere, and each group is projected with a single
+    ``transform`` call on NumPy arrays, reusing one cached pyproj transformer per zone.
+
+    Args:
+        lon (np.ndarray): Longitudes.
+        lat (np.ndarray): Latitudes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[str]]: UTM coordinates (x, y) and the EPSG code of every point.
+
+    Raises:
+        ValueError: If any point is outside the latitude or longitude range covered by UTM.
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+
+    # Range covered by UTM, checked on the whole arrays before projecting
+    # (NaN fails every comparison, so it is rejected too)
+    if not np.all((lat >= -80) & (lat <= 84)):
+        raise ValueError("latitude out of range (must be between 80 deg S and 84 deg N)")
+    if not np.all((lon >= -180) & (lon <= 180)):
+        raise ValueError("longitude out of range (must be between 180 deg W and 180 deg E)")
+
+    # Position of every point's zone in the EPSG table, used both to group and to label them
+    zone = utm_zones(lon, lat)
+    index = np.where(lat >= 0, zone - 1, zone + 59)
+
+    x = np.empty_like(lon)
+    y = np.empty_like(lat)
+    for i in np.unique(index).tolist():
+        mask = index == i
+        x[mask], y[mask] = _utm_transformer(_UTM_EPSG[i]).transform(lon[mask], lat[mask])
+
+    return x, y, [_UTM_EPSG[i] for i in index.tolist()]
+
+
+def lonlat2epsg(lon: float, lat: float) -> str:
+    """
+    Returns the EPSG code of the UTM zone containing a geographic point.
+
+    No projection is computed: the zone is derived with integer arithmetic only,
+    which makes this the cheap option when the UTM coordinates are already known
+    or not needed.
+
+    Args:
+        lon (float): Longitude.
+        lat (float): Latitude.
+
+    Returns:
+        str: The EPSG code in the form ``"EPSG:XYZ"``.
+
+    Raises:
+        ValueError: If the point is outside the latitude or longitude range covered by UTM.
+
+    Example:
+        >>> lonlat2epsg(-76.0, 40.0)
+        'EPSG:32618'
     """
-    x, y, zone, _ = utm.from_latlon(lat, lon)
-    epsg_code = f"326{zone:02d}" if lat >= 0 else f"327{zone:02d}"
-    return x, y, f"EPSG:{epsg_code}"
+    # Range covered by UTM; the chained comparisons also reject NaN
+    if not -80 <= lat <= 84:
+        raise ValueError("latitude out of range (must be between 80 deg S and 84 deg N)")
+    if not -180 <= lon <= 180:
+        raise ValueError("longitude out of range (must be between 180 deg W and 180 deg E)")
 
+    # Normalize the longitude to [-180, 180) before bucketing it in 6° zones
+    lon = (lon + 180) % 360 - 180
+    zone = int((lon + 180) // 6) + 1
 
-def lonlat2rt(lon: float, lat: float, edge_size: int, scale: int) -> RasterTransform:
+    # Standard UTM zone exceptions: south-western Norway and Svalbard
+    if 56 <= lat < 64 and 3 <= lon < 12:
+        zone = 32
+    elif 72 <= lat <= 84 and lon >= 0:
+        if lon < 9:
+            zone = 31
+        elif lon < 21:
+            zone = 33
+        elif lon < 33:
+            zone = 35
+        elif lon < 42:
+            zone = 37
+
+    return _zone_epsg(zone, lat >= 0)
+
+
+def _check_extent(edge_size: int, scale: NumberType) -> tuple[int, NumberType]:
+    """
+    Validates and normalizes the raster size arguments of :func:`lonlat2rt` and :func:`lonlat2rt_batch`.
+
+    These functions build ``RasterTransform`` instances without running the pydantic validators,
+    so the only user-provided values are checked here once, with the same rules. Integral values
+    given as floats (e.g. ``128.0``) are converted to ``int`` so the rest of the computation and
+    the resulting geotransform stay on integers where possible.
+
+    Args:
+        edge_size (int): Width and height of the output raster in pixels.
+        scale (NumberType): Spatial resolution in meters per pixel.
+
+    Returns:
+        Tuple[int, NumberType]: ``edge_size`` as an ``int`` and ``scale``, as an ``int`` when integral.
+
+    Raises:
+        ValueError: If ``edge_size`` is not a positive integer or ``scale`` is not a non-zero number.
+    """
+    # `int()` raises on inf/NaN, so rule out non-finite sizes first
+    if not math.isfinite(edge_size) or int(edge_size) != edge_size or edge_size <= 0:
+        raise ValueError(
+            f"edge_size must be a positive integer, but got {edge_size}"
+        )
+    if not isinstance(scale, (int, float)):
+        raise ValueError("Value for 'scale' must be numeric (int or float)")
+    if not scale:
+        raise ValueError("Scale values cannot be zero")
+    if isinstance(scale, float) and scale.is_integer():
+        scale = int(scale)
+    return int(edge_size), scale
+
+
+def lonlat2rt(lon: float, lat: float, edge_size: int, scale: NumberType) -> RasterTransform:
     """
     Generates a ``RasterTransform`` for a given point by converting geographic (lon, lat) coordinates
     to UTM projection and building the necessary geotransform metadata.
@@ -38,7 +218,7 @@ def lonlat2rt(lon: float, lat: float, edge_size: int, scale: int) -> RasterTrans
         lon (float): The longitude coordinate.
         lat (float): The latitude coordinate.
         edge_size (int): Width and height of the output raster in pixels.
-        scale (int): Spatial resolution in meters per pixel.
+        scale (NumberType): Spatial resolution in meters per pixel.
 
     Returns:
         RasterTransform: A Pydantic model containing:
@@ -46,6 +226,9 @@ def lonlat2rt(lon: float, lat: float, edge_size: int, scale: int) -> RasterTrans
          - ``geotransform``: A dictionary with the affine transform parameters,
          - ``width`` and ``height``.
 
+    Raises:
+        ValueError: If the point is outside the range covered by UTM, or ``edge_size``/``scale`` are invalid.
+
     Example:
         >>> import cubexpress
         >>> rt = cubexpress.lonlat2rt(
@@ -56,18 +239,66 @@ def lonlat2rt(lon: float, lat: float, edge_size: int, scale: int) -> RasterTrans
         ... )
         >>> print(rt)
     """
+    edge_size, scale = _check_extent(edge_size, scale)
     x, y, crs = geo2utm(lon, lat)
-    half_extent = (edge_size * scale) / 2
-
-    geotransform = GeotransformDict(
-        scaleX=scale,
-        shearX=0,
-        translateX=x - half_extent,
-        scaleY=-scale,  # Y-axis is inverted in geospatial images
-        shearY=0,
-        translateY=y + half_extent,
-    )
+    half_extent = edge_size * scale * 0.5
+
+    geotransform: GeotransformDict = {
+        "scaleX": scale,
+        "shearX": 0,
+        "translateX": float(x - half_extent),
+        "scaleY": -scale,  # Y-axis is inverted in geospatial images
+        "shearY": 0,
+        "translateY": float(y + half_extent),
+    }
 
-    return RasterTransform(
+    # Every field is produced here from validated inputs, so skip pydantic validation
+    return RasterTransform.model_construct(
         crs=crs, geotransform=geotransform, width=edge_size, height=edge_size
     )
+
+
+def lonlat2rt_batch(
+    lon: np.ndarray, lat: np.ndarray, edge_size: int, scale: NumberType
+) -> RasterTransformBatch:
+    """
+    Vectorized version of :func:`lonlat2rt` for many points sharing the same ``edge_size`` and ``scale``.
+
+    The UTM projection and the raster extents are computed with array arithmetic and kept as
+    arrays: each ``RasterTransform`` is only built when the batch is indexed or iterated.
+
+    Args:
+        lon (np.ndarray): The longitude coordinates.
+        lat (np.ndarray): The latitude coordinates.
+        edge_size (int): Width and height of the output rasters in pixels.
+        scale (NumberType): Spatial resolution in meters per pixel.
+
+    Returns:
+        RasterTransformBatch: One raster per input point, in the same order.
+
+    Raises:
+        ValueError: If any point is outside the range covered by UTM, or ``edge_size``/``scale`` are invalid.
+
+    Example:
+        >>> import cubexpress
+        >>> rts = cubexpress.lonlat2rt_batch(
+        ...     lon=[-76.0, -75.5],
+        ...     lat=[40.0, 40.5],
+        ...     edge_size=512,
+        ...     scale=30
+        ... )
+        >>> len(rts)
+        2
+    """
+    edge_size, scale = _check_extent(edge_size, scale)
+    x, y, crs = geo2utm_batch(lon, lat)
+    half_extent = edge_size * scale * 0.5
+
+    return RasterTransformBatch(
+        crs=crs,
+        translate_x=x - half_extent,
+        translate_y=y + half_extent,
+        scale=scale,
+        width=edge_size,
+        height=edge_size,
+    )
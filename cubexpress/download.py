@@ -1,16 +1,37 @@
 import concurrent.futures
 import json
+import os
 import pathlib
 from concurrent.futures import ThreadPoolExecutor
-from copy import deepcopy
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 import ee
-import numpy as np
 import pandas as pd
 
 from cubexpress.geotyping import RequestSet
 
+# Earth Engine endpoint meant for many concurrent, small requests such as getPixels/computePixels
+HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+
+def initialize_high_volume(project: Optional[str] = None, **kwargs: Any) -> None:
+    """
+    Initializes Earth Engine against the high-volume endpoint.
+
+    The default endpoint throttles many simultaneous requests, so use this instead of
+    ``ee.Initialize()`` before calling :func:`getcube` with several workers.
+
+    Args:
+        project (Optional[str], default=None): The Google Cloud project to use.
+        **kwargs: Any other argument accepted by ``ee.Initialize``.
+
+    Example:
+        >>> import cubexpress
+        >>> cubexpress.initialize_high_volume(project="your-project-id")
+    """
+    ee.Initialize(project=project, url=HIGH_VOLUME_URL, **kwargs)
+
 
 def check_not_found_error(error_message: str) -> bool:
     """
@@ -32,6 +53,23 @@ def check_not_found_error(error_message: str) -> bool:
     )
 
 
+@lru_cache(maxsize=128)
+def decode_expression(expression: str) -> ee.Image:
+    """
+    Decodes a serialized Earth Engine expression into an ``ee.Image``.
+
+    Requests built from the same image (e.g. one expression over many points) share the
+    serialized string, so the JSON parsing and decoding are cached and done once per expression.
+
+    Args:
+        expression (str): The expression, as serialized by ``ee.Image.serialize()``.
+
+    Returns:
+        ee.Image: The decoded image.
+    """
+    return ee.deserializer.decode(json.loads(expression))
+
+
 def quadsplit_manifest(manifest: dict) -> list[dict]:
     """
     Splits a manifest into four smaller ones by dividing the grid dimensions.
@@ -47,41 +85,43 @@ def quadsplit_manifest(manifest: dict) -> list[dict]:
         >>> quadsplit_manifest(manifest)
         [{'grid': {'dimensions': {'width': 50, 'height': 50}, 'affineTransform': {'scaleX': 0.1, 'scaleY': 0.1, 'translateX': 0, 'translateY': 0}}}, {'grid': {'dimensions': {'width': 50, 'height': 50}, 'affineTransform': {'scaleX': 0.1, 'scaleY': 0.1, 'translateX': 5.0, 'translateY': 0}}}, ...]
     """
-    manifest_copy = deepcopy(manifest)
-    new_width = manifest["grid"]["dimensions"]["width"] // 2
-    new_height = manifest["grid"]["dimensions"]["height"] // 2
-    manifest_copy["grid"]["dimensions"]["width"] = new_width
-    manifest_copy["grid"]["dimensions"]["height"] = new_height
-
-    manifests = []
-    for idx in range(4):
-        new_manifest = deepcopy(manifest_copy)
-        res_x = manifest["grid"]["affineTransform"]["scaleX"]
-        res_y = manifest["grid"]["affineTransform"]["scaleY"]
-
-        add_x, add_y = (0, 0)
-        if idx == 1:
-            add_x = new_width * res_x
-        elif idx == 2:
-            add_y = new_height * res_y
-        elif idx == 3:
-            add_x = new_width * res_x
-            add_y = new_height * res_y
-
-        new_manifest["grid"]["affineTransform"]["translateX"] += add_x
-        new_manifest["grid"]["affineTransform"]["translateY"] += add_y
-
-        manifests.append(new_manifest)
-
-    return manifests
+    grid = manifest["grid"]
+    affine = grid["affineTransform"]
+    dimensions = {
+        "width": grid["dimensions"]["width"] // 2,
+        "height": grid["dimensions"]["height"] // 2,
+    }
+
+    # The offsets of the right and bottom quadrants are the same for all of them
+    step_x = dimensions["width"] * affine["scaleX"]
+    step_y = dimensions["height"] * affine["scaleY"]
+    translate_x, translate_y = affine["translateX"], affine["translateY"]
+
+    # Only the grid differs between the quadrants: build it as a fresh dict and share
+    # every other value with the parent, which is never mutated
+    return [
+        {
+            **manifest,
+            "grid": {
+                **grid,
+                "dimensions": dimensions,
+                "affineTransform": {
+                    **affine,
+                    "translateX": translate_x + add_x,
+                    "translateY": translate_y + add_y,
+                },
+            },
+        }
+        for add_x, add_y in ((0, 0), (step_x, 0), (0, step_y), (step_x, step_y))
+    ]
 
 
 def getGeoTIFFbatch(
     manifest_dict: dict,
     full_outname: pathlib.Path,
-    max_deep_level: Optional[int] = 5,
-    method: Optional[str] = "getPixels",
-) -> Optional[np.ndarray]:
+    max_deep_level: int = 5,
+    method: str = "getPixels",
+) -> pathlib.Path:
     """
     Downloads a GeoTIFF image from Google Earth Engine using either the `getPixels` or `computePixels` method.
     If the requested area exceeds the size limit, the image is recursively split into smaller tiles until the
@@ -91,12 +131,12 @@ def getGeoTIFFbatch(
         manifest_dict (dict): A dictionary containing image metadata, including grid dimensions, affine transformations,
                               and either an `assetId` or `expression` for the image source.
         full_outname (pathlib.Path): The full path where the downloaded GeoTIFF file will be saved.
-        max_deep_level (Optional[int]): Maximum recursion depth for splitting large requests. Defaults to 5.
-        method (Optional[str]): Method for retrieving image data. Can be 'getPixels' for asset-based requests or
+        max_deep_level (int): Maximum recursion depth for splitting large requests. Defaults to 5.
+        method (str): Method for retrieving image data. Can be 'getPixels' for asset-based requests or
                                 'computePixels' for expressions. Defaults to 'getPixels'.
 
     Returns:
-        Optional[pathlib.Path]: The path to the downloaded GeoTIFF file. Returns `None` if the download fails.
+        pathlib.Path: The path to the downloaded GeoTIFF file.
 
     Raises:
         ValueError: If the method is not 'getPixels' or 'computePixels', or if the image cannot be found.
@@ -130,18 +170,43 @@ def getGeoTIFFbatch(
         PosixPath('output/sentinel_image.tif')
     """
 
+    # Resolve the Earth Engine endpoint once; the recursion below reuses it for every tile
+    if method == "getPixels":
+        fetch = ee.data.getPixels
+    elif method == "computePixels":
+        fetch = ee.data.computePixels
+    else:
+        raise ValueError("Method must be either 'getPixels' or 'computePixels'")
+
+    return _fetch_geotiff(fetch, manifest_dict, full_outname, max_deep_level)
+
+
+def _fetch_geotiff(
+    fetch: Callable[[dict], bytes],
+    manifest_dict: dict,
+    full_outname: pathlib.Path,
+    max_deep_level: int,
+) -> pathlib.Path:
+    """
+    Recursive worker of :func:`getGeoTIFFbatch`, bound to an already resolved Earth Engine endpoint.
+
+    Args:
+        fetch (Callable[[dict], bytes]): Either ``ee.data.getPixels`` or ``ee.data.computePixels``.
+        manifest_dict (dict): The manifest of the (sub-)tile to download.
+        full_outname (pathlib.Path): The full path where the GeoTIFF file will be saved.
+        max_deep_level (int): Remaining recursion depth for splitting large requests.
+
+    Returns:
+        pathlib.Path: The path to the downloaded GeoTIFF file.
+    """
+
     # Check if the maximum recursion depth has been reached
     if max_deep_level == 0:
         raise ValueError("Max recursion depth reached.")
 
     try:
         # Get the image bytes
-        if method == "getPixels":
-            image_bytes: bytes = ee.data.getPixels(manifest_dict)
-        elif method == "computePixels":
-            image_bytes: bytes = ee.data.computePixels(manifest_dict)
-        else:
-            raise ValueError("Method must be either 'getPixels' or 'computePixels'")
+        image_bytes: bytes = fetch(manifest_dict)
 
         # Write the image bytes to a file
         with open(full_outname, "wb") as src:
@@ -163,19 +228,19 @@ def getGeoTIFFbatch(
 
         for idx, manifest_dict_batch in enumerate(manifest_dicts):
             # Recursively download the image
-            getGeoTIFFbatch(
-                full_outname=child_folder / ("%s__%02d.tif" % (full_outname.stem, idx)),
-                manifest_dict=manifest_dict_batch,
-                max_deep_level=max_deep_level - 1,
-                method=method,
+            _fetch_geotiff(
+                fetch,
+                manifest_dict_batch,
+                child_folder / ("%s__%02d.tif" % (full_outname.stem, idx)),
+                max_deep_level - 1,
             )
 
     return full_outname
 
 
 def getGeoTIFF(
-    manifest_dict: dict, full_outname: pathlib.Path, max_deep_level: Optional[int] = 5
-) -> Optional[np.ndarray]:
+    manifest_dict: dict, full_outname: pathlib.Path, max_deep_level: int = 5
+) -> pathlib.Path:
     """
     Retrieves an image from Earth Engine using the appropriate method based on the manifest type.
 
@@ -193,12 +258,11 @@ def getGeoTIFF(
 
         full_outname (pathlib.Path): The full path where the downloaded GeoTIFF file will be saved.
 
-        max_deep_level (Optional[int]): The maximum recursion depth for splitting large requests into smaller tiles if needed.
+        max_deep_level (int): The maximum recursion depth for splitting large requests into smaller tiles if needed.
             Defaults to 5.
 
     Returns:
-        Optional[np.ndarray]: The downloaded image as a `numpy` array, or `None` if the download fails. It will
-            also return the full file path to the saved GeoTIFF image.
+        pathlib.Path: The full file path to the saved GeoTIFF image.
 
     Raises:
         ValueError: If the manifest does not contain either an `assetId` or `expression`, or if there is an error during download.
@@ -262,10 +326,12 @@ def getGeoTIFF(
         if isinstance(
             manifest_dict["expression"], str
         ):  # Decode only if the expression is still a string.
-            # From a string to a ee.Image object
-            manifest_dict["expression"] = ee.deserializer.decode(
-                json.loads(manifest_dict["expression"])
-            )
+            # From a string to a ee.Image object. The caller's manifest is left untouched
+            # (it stays JSON-serializable) and the decoded image goes into a shallow copy.
+            manifest_dict = {
+                **manifest_dict,
+                "expression": decode_expression(manifest_dict["expression"]),
+            }
 
         return getGeoTIFFbatch(
             manifest_dict=manifest_dict,
@@ -281,23 +347,27 @@ def getcube(
     request: RequestSet,
     output_path: str | pathlib.Path,
     nworkers: Optional[int] = None,
-    max_deep_level: Optional[int] = 5,
+    max_deep_level: int = 5,
 ) -> list[pathlib.Path]:
     """
     Downloads multiple GeoTIFF images in parallel from Google Earth Engine (GEE) based on the provided request set.
 
+    With more than one worker, initialize Earth Engine with :func:`initialize_high_volume`
+    so the concurrent requests are not throttled by the default endpoint.
+
     Args:
         request (RequestSet): A collection of image requests containing metadata and processing parameters.
         output_path (Union[str, pathlib.Path]): Directory where the downloaded images will be saved.
-        nworkers (Optional[int], default=None): Number of parallel threads. If None, runs sequentially.
-        max_deep_level (Optional[int], default=5): Maximum recursion depth for image subdivision if exceeding GEE limits.
+        nworkers (Optional[int], default=None): Number of parallel threads. If None, uses the
+            ``ThreadPoolExecutor`` default of ``min(32, os.cpu_count() + 4)``; pass 1 to download sequentially.
+        max_deep_level (int, default=5): Maximum recursion depth for image subdivision if exceeding GEE limits.
 
     Returns:
         List[pathlib.Path]: List of paths to the downloaded GeoTIFF files.
 
     Example:
         >>> import ee, cubexpress
-        >>> ee.Initialize()
+        >>> cubexpress.initialize_high_volume(project="your-project-id")
         >>> point = ee.Geometry.Point([-97.59, 33.37])
         >>> collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED") \
         ...                 .filterBounds(point) \
@@ -327,21 +397,40 @@ def getcube(
     output_path = pathlib.Path(output_path)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Keep at most two tasks per worker in flight, so a large table does not
+    # materialize one future per row up front
+    max_workers = nworkers or min(32, (os.cpu_count() or 1) + 4)
+    max_in_flight = 2 * max_workers
+
     results = []
-    with ThreadPoolExecutor(max_workers=nworkers) as executor:
-        futures = {
-            executor.submit(
-                getGeoTIFF, row.manifest, output_path / row.outname, max_deep_level
-            ): row
-            for _, row in table.iterrows()
-        }
-        for future in concurrent.futures.as_completed(futures):
+    futures: dict[concurrent.futures.Future, str] = {}
+
+    def collect(done: set[concurrent.futures.Future]) -> None:
+        for future in done:
+            outname = futures.pop(future)
             try:
                 result = future.result()
                 if result:
                     results.append(result)
             except Exception as e:
                 # TODO add this into the log
-                print(f"Error processing {futures[future].outname}: {e}")
+                print(f"Error processing {outname}: {e}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Zip the two columns directly instead of building a Series per row
+        for manifest, outname in zip(table["manifest"], table["outname"]):
+            if len(futures) >= max_in_flight:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                collect(done)
+            future = executor.submit(
+                getGeoTIFF, manifest, output_path / outname, max_deep_level
+            )
+            futures[future] = outname
+
+        # Wait for the remaining tasks
+        done, _ = concurrent.futures.wait(futures)
+        collect(done)
 
     return results
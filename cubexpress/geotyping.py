@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import json
+import math
+import operator
+import os
+import pathlib
+import re
 from concurrent.futures import ProcessPoolExecutor
-from typing import Any, Final, List, Set, TypeAlias
+from functools import lru_cache
+from typing import Any, Final, Iterator, List, Optional, Set, Tuple, TypeAlias, Union, overload
 
 import ee
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, field_validator, model_validator
 from pyproj import CRS, Transformer
 from typing_extensions import TypedDict
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library is used instead
+    orjson = None
+
 # Type definitions
 NumberType: TypeAlias = int | float
 
@@ -22,56 +35,95 @@ REQUIRED_KEYS: Final[Set[str]] = {
     "translateY",
 }
 
+# EPSG codes of the WGS84 UTM zones: EPSG:32601-32660 (north) and EPSG:32701-32760 (south)
+UTM_EPSG_PATTERN: Final = re.compile(r"EPSG:32[67](?:0[1-9]|[1-5][0-9]|60)")
+
+# Fetches the six affine parameters of a geotransform in a single C-level call
+GEOTRANSFORM_GETTER: Final = operator.itemgetter(
+    "scaleX", "shearX", "translateX", "scaleY", "shearY", "translateY"
+)
 
-def get_transformer(source_crs_wkt: str) -> Transformer:
-    """Get cached transformer from source CRS to WGS84 (EPSG:4326)"""
-    target_crs = CRS.from_epsg(4326)
+
+# NumPy column dtypes whose values are guaranteed to pass `isinstance(value, expected_type)`
+_NUMERIC_DTYPE_CHECKS: Final = {
+    float: pd.api.types.is_float_dtype,
+    int: pd.api.types.is_integer_dtype,
+    (int, float): lambda dtype: (
+        pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def get_transformer(source_crs: str) -> Transformer:
+    """Get cached transformer from source CRS (EPSG code or WKT) to WGS84 (EPSG:4326)"""
     return Transformer.from_crs(
-        CRS.from_wkt(source_crs_wkt),
-        target_crs,
+        CRS.from_user_input(source_crs),
+        CRS.from_epsg(4326),
         always_xy=True,  # Ensures consistent x,y order
     )
 
 
-def rt2lonlat(raster: "RasterTransform") -> tuple[float, float]:
+def rt2lonlat_batch(
+    rasters: List["RasterTransform"],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Calculate the geographic centroid in WGS84 with optimized performance.
+    Calculate the geographic centroids in WGS84 of many rasters.
+
+    The centroids are computed with array arithmetic, then grouped by CRS so every
+    distinct CRS is reprojected with a single ``transform`` call on arrays, instead
+    of one call per raster. The transformer is cached per CRS string and a WGS84
+    source gets a no-op pipeline.
 
     Args:
-        raster: RasterTransform instance with geospatial metadata
+        rasters: RasterTransform instances with geospatial metadata
 
     Returns:
-        Tuple of (longitude, latitude) in WGS84 coordinates
+        Tuple of (longitude, latitude, x, y) arrays, in the same order as ``rasters``
     """
-    # Calculate pixel coordinates of raster center
-    col_center = (raster.width - 1) / 2.0
-    row_center = (raster.height - 1) / 2.0
-
-    # Extract geotransform parameters as local variables for faster access
-    gt = raster.geotransform
-    tx = gt["translateX"]
-    sx = gt["scaleX"]
-    shx = gt["shearX"]
-    ty = gt["translateY"]
-    shy = gt["shearY"]
-    sy = gt["scaleY"]
+    # One row of affine parameters per raster, split into one array per parameter
+    sx, shx, tx, sy, shy, ty = np.array(
+        [GEOTRANSFORM_GETTER(raster.geotransform) for raster in rasters],
+        dtype=np.float64,
+    ).reshape(-1, 6).T
+    col_center = (np.array([raster.width for raster in rasters]) - 1) / 2.0
+    row_center = (np.array([raster.height for raster in rasters]) - 1) / 2.0
 
     # Apply affine transformation
     x = tx + sx * col_center + shx * row_center
     y = ty + shy * col_center + sy * row_center
 
-    # Check if transformation is needed
-    source_crs = CRS.from_user_input(raster.crs)
-    target_crs = CRS.from_epsg(4326)
+    # Reproject each CRS group at once and scatter the result back in place
+    lon = np.empty_like(x)
+    lat = np.empty_like(y)
+    codes, group = np.unique([raster.crs for raster in rasters], return_inverse=True)
+    for i, crs in enumerate(codes.tolist()):
+        mask = group == i
+        lon[mask], lat[mask] = get_transformer(crs).transform(x[mask], y[mask])
 
-    if source_crs == target_crs:
-        return (x, y)
+    return lon, lat, x, y
 
-    # Perform the transformation
-    transformer = get_transformer(source_crs.to_wkt())
-    lon, lat = transformer.transform(x, y)
 
-    return lon, lat, x, y
+def _json_default(value: Any) -> Any:
+    """Converts NumPy scalars to their Python equivalent for the standard ``json`` encoder."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using ``orjson`` when it is installed.
+
+    Args:
+        obj (Any): The object to serialize, typically a manifest.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_json_default).encode()
 
 
 class GeotransformDict(TypedDict):
@@ -100,7 +152,6 @@ class RasterTransform(BaseModel):
     Represents a single geospatial metadata entry with CRS and transformation information.
 
     Attributes:
-        id (str): The unique identifier for the raster metadata.
         crs (str): The Coordinate Reference System string (EPSG code or WKT).
         geotransform (GeotransformDict): A dictionary containing spatial transformation parameters.
         width (int): Raster width in pixels.
@@ -108,7 +159,6 @@ class RasterTransform(BaseModel):
 
     Example:
         >>> metadata = RasterTransform(
-        ...     id="image1",
         ...     crs="EPSG:4326",
         ...     geotransform={
         ...         'scaleX': 1.0, 'shearX': 0, 'translateX': 100.0,
@@ -147,16 +197,19 @@ class RasterTransform(BaseModel):
                 f"Expected geotransform to be a dictionary, got {type(geotransform)}"
             )
 
-        missing_keys = REQUIRED_KEYS - set(geotransform.keys())
-        if missing_keys:
-            raise ValueError(f"Missing required keys: {missing_keys}")
+        # Single keys-view comparison on the happy path; the set differences
+        # are only computed to build the error message
+        if geotransform.keys() != REQUIRED_KEYS:
+            missing_keys = REQUIRED_KEYS - geotransform.keys()
+            if missing_keys:
+                raise ValueError(f"Missing required keys: {missing_keys}")
 
-        extra_keys = set(geotransform.keys()) - REQUIRED_KEYS
-        if extra_keys:
+            extra_keys = geotransform.keys() - REQUIRED_KEYS
             raise ValueError(f"Unexpected keys found: {extra_keys}")
 
-        for key in REQUIRED_KEYS:
-            if not isinstance(geotransform[key], (int, float)):
+        # Keys are exactly REQUIRED_KEYS at this point, iterate the items directly
+        for key, value in geotransform.items():
+            if not isinstance(value, (int, float)):
                 raise ValueError(f"Value for '{key}' must be numeric (int or float)")
 
         if not (geotransform["scaleX"] and geotransform["scaleY"]):
@@ -216,12 +269,102 @@ class RasterTransform(BaseModel):
         return f"RasterTransform(crs={self.crs}, width={self.width}, height={self.height})\n\nGeotransform:\n{geotransform_df}"
 
 
+class RasterTransformBatch:
+    """
+    Columnar (structure-of-arrays) collection of north-up rasters sharing the same size and resolution.
+
+    Instead of one ``RasterTransform`` (and one geotransform dict) per raster, only the values that
+    change between rasters are stored, as contiguous arrays. A ``RasterTransform`` is materialized
+    on demand when an element is accessed, and slicing returns a new ``RasterTransformBatch``.
+
+    Attributes:
+        crs (List[str]): The CRS of every raster.
+        translate_x (np.ndarray): The X translation of every raster.
+        translate_y (np.ndarray): The Y translation of every raster.
+        scale (NumberType): Spatial resolution shared by all rasters (``scaleX``; ``scaleY`` is ``-scale``).
+        width (int): Raster width in pixels, shared by all rasters.
+        height (int): Raster height in pixels, shared by all rasters.
+
+    Example:
+        >>> rts = cubexpress.lonlat2rt_batch(lon=[-76.0, -75.5], lat=[40.0, 40.5], edge_size=512, scale=30)
+        >>> rts[0]
+        RasterTransform(crs='EPSG:32618', geotransform={...}, width=512, height=512)
+    """
+
+    __slots__ = ("crs", "translate_x", "translate_y", "scale", "width", "height")
+
+    def __init__(
+        self,
+        crs: List[str],
+        translate_x: np.ndarray,
+        translate_y: np.ndarray,
+        scale: NumberType,
+        width: int,
+        height: int,
+    ) -> None:
+        self.crs = crs
+        self.translate_x = translate_x
+        self.translate_y = translate_y
+        self.scale = scale
+        self.width = width
+        self.height = height
+
+    def __len__(self) -> int:
+        return len(self.crs)
+
+    @overload
+    def __getitem__(self, index: int) -> RasterTransform: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RasterTransformBatch: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[RasterTransform, RasterTransformBatch]:
+        if isinstance(index, slice):
+            # Slicing the arrays returns views, so no coordinates are copied
+            return RasterTransformBatch(
+                crs=self.crs[index],
+                translate_x=self.translate_x[index],
+                translate_y=self.translate_y[index],
+                scale=self.scale,
+                width=self.width,
+                height=self.height,
+            )
+        # NumPy would accept other index types (e.g. lists or masks) and return arrays
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError(
+                f"RasterTransformBatch indices must be integers or slices, not {type(index).__name__}"
+            )
+
+        # The values were computed from validated inputs, so skip pydantic validation
+        return RasterTransform.model_construct(
+            crs=self.crs[index],
+            geotransform={
+                "scaleX": self.scale,
+                "shearX": 0,
+                "translateX": float(self.translate_x[index]),
+                "scaleY": -self.scale,  # Y-axis is inverted in geospatial images
+                "shearY": 0,
+                "translateY": float(self.translate_y[index]),
+            },
+            width=self.width,
+            height=self.height,
+        )
+
+    def __iter__(self) -> Iterator[RasterTransform]:
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"RasterTransformBatch({len(self)} entries)"
+
+
 class Request(BaseModel):
     id: str
     raster_transform: RasterTransform
     image: Any
-    bands: List[str]
-    _expression_key: str = None
+    bands: Tuple[str, ...]
+    _expression_key: Optional[str] = None
 
     @model_validator(mode="after")
     def validate_image(self):
@@ -241,14 +384,14 @@ class Request(BaseModel):
 
 class RequestSet(BaseModel):
     """
-    Container for multiple RasterTransform instances with bulk validation capabilities.
+    Container for multiple Request instances with bulk validation capabilities.
 
     Attributes:
-        rastertransformset (List[RasterTransform]): A list of RasterTransform metadata entries.
+        requestset (List[Request]): A list of Request entries.
 
     Example:
-        >>> metadatas = RasterTransformSet(rastertransformset=[metadata1, metadata2])
-        >>> df = metadatas.export_df()
+        >>> cube_requests = RequestSet(requestset=[request1, request2])
+        >>> df = cube_requests.create_manifests()
     """
 
     requestset: List[Request]
@@ -258,58 +401,78 @@ class RequestSet(BaseModel):
 
     def create_manifests(self) -> pd.DataFrame:
         """
-        Exports the raster metadata to a pandas DataFrame.
+        Exports the request metadata and manifests to a pandas DataFrame.
 
         Returns:
             pd.DataFrame: A DataFrame containing the metadata for all entries.
 
         Example:
-            >>> df = raster_transform_set.export_df()
+            >>> df = cube_requests.create_manifests()
             >>> print(df)
         """
-        # Use ProcessPoolExecutor for CPU-bound tasks to convert raster transforms to lon/lat
-        with ProcessPoolExecutor(max_workers=None) as executor:
-            # Submit all tasks to the executor
-            futures = [
-                executor.submit(rt2lonlat, rt.raster_transform)
-                for rt in self.requestset
-            ]
-
-            # Collect results as they complete
-            points = [future.result() for future in futures]
-            lon, lat, x, y = zip(*points)
+        # Use ProcessPoolExecutor for CPU-bound tasks to convert raster transforms to lon/lat.
+        # Requests are sent in one chunk per worker rather than one task per request, so the
+        # pickling and inter-process round-trips are paid per chunk, and each chunk is
+        # reprojected with one vectorized call per CRS.
+        nworkers = os.cpu_count() or 1
+        rasters = [meta.raster_transform for meta in self.requestset]
+        chunksize = math.ceil(len(rasters) / nworkers) or 1
+        with ProcessPoolExecutor(max_workers=nworkers) as executor:
+            chunks = executor.map(
+                rt2lonlat_batch,
+                [rasters[i : i + chunksize] for i in range(0, len(rasters), chunksize)],
+            )
+            lon, lat, x, y = map(np.concatenate, zip(*chunks))
 
-        return pd.DataFrame(
-            [
+        # Build the table column-wise: one list per field instead of one dict
+        # per row, so pandas can allocate each column block in a single pass.
+        ids, crss, widths, heights, geotransforms, manifests, outnames = (
+            [] for _ in range(7)
+        )
+        for meta in self.requestset:
+            # Bind every value once so the manifest below is a single dict
+            # literal built from locals, with no attribute chains inside it.
+            rt = meta.raster_transform
+            crs, width, height, gt = rt.crs, rt.width, rt.height, rt.geotransform
+
+            ids.append(meta.id)
+            crss.append(crs)
+            widths.append(width)
+            heights.append(height)
+            geotransforms.append(gt)
+            manifests.append(
                 {
-                    "id": meta.id,
-                    "lon": lon[index],
-                    "lat": lat[index],
-                    "x": x[index],
-                    "y": y[index],
-                    "crs": meta.raster_transform.crs,
-                    "width": meta.raster_transform.width,
-                    "height": meta.raster_transform.height,
-                    "geotransform": meta.raster_transform.geotransform,
-                    "scale_x": meta.raster_transform.geotransform["scaleX"],
-                    "scale_y": meta.raster_transform.geotransform["scaleY"],
-                    "manifest": {
-                        meta._expression_key: meta.image,
-                        "fileFormat": "GEO_TIFF",
-                        "bandIds": meta.bands,
-                        "grid": {
-                            "dimensions": {
-                                "width": meta.raster_transform.width,
-                                "height": meta.raster_transform.height,
-                            },
-                            "affineTransform": meta.raster_transform.geotransform,
-                            "crsCode": meta.raster_transform.crs,
-                        },
+                    meta._expression_key: meta.image,
+                    "fileFormat": "GEO_TIFF",
+                    "bandIds": meta.bands,
+                    "grid": {
+                        "dimensions": {"width": width, "height": height},
+                        "affineTransform": gt,
+                        "crsCode": crs,
                     },
-                    "outname": f"{meta.id}.tif",
                 }
-                for index, meta in enumerate(self.requestset)
-            ]
+            )
+            outnames.append(f"{meta.id}.tif")
+
+        # Every column is built once above and owned by this table, so let pandas
+        # adopt the lon/lat/x/y arrays instead of copying them
+        return pd.DataFrame(
+            {
+                "id": ids,
+                "lon": lon,
+                "lat": lat,
+                "x": x,
+                "y": y,
+                "crs": crss,
+                "width": widths,
+                "height": heights,
+                "geotransform": geotransforms,
+                "scale_x": [gt["scaleX"] for gt in geotransforms],
+                "scale_y": [gt["scaleY"] for gt in geotransforms],
+                "manifest": manifests,
+                "outname": outnames,
+            },
+            copy=False,
         )
 
 
@@ -352,21 +515,31 @@ class RequestSet(BaseModel):
 
         # 3. Verify data types (basic check)
         for col_name, expected_type in required_columns.items():
-            for i, value in enumerate(self._dataframe[col_name]):
+            column = self._dataframe[col_name]
+
+            # A column with a native NumPy numeric dtype only yields values of that
+            # type: check the dtype once instead of every value. Extension dtypes
+            # (e.g. nullable Int64/Float64) can hold pd.NA, so they are checked per value
+            dtype_check = _NUMERIC_DTYPE_CHECKS.get(expected_type)
+            if (
+                dtype_check is not None
+                and isinstance(column.dtype, np.dtype)
+                and dtype_check(column.dtype)
+            ):
+                continue
+
+            for i, value in enumerate(column):
+                # `isinstance` accepts a tuple of types, e.g. (int, float)
                 if not isinstance(value, expected_type):
-                    # For cases like (int, float), you can check with isinstance(value, (int, float))
-                    # or directly use the tuple in `expected_type`
                     if isinstance(expected_type, tuple):
-                        if not any(isinstance(value, t) for t in expected_type):
-                            raise ValueError(
-                                f"Column '{col_name}' has an invalid type in row {i}. "
-                                f"Expected one of {expected_type}, got {type(value)}"
-                            )
-                    else:
                         raise ValueError(
                             f"Column '{col_name}' has an invalid type in row {i}. "
-                            f"Expected {expected_type}, got {type(value)}"
+                            f"Expected one of {expected_type}, got {type(value)}"
                         )
+                    raise ValueError(
+                        f"Column '{col_name}' has an invalid type in row {i}. "
+                        f"Expected {expected_type}, got {type(value)}"
+                    )
 
         # B) Validation of the `manifest` column structure
         #    - Must contain at least 'assetId' or 'expression'
@@ -382,25 +555,24 @@ class RequestSet(BaseModel):
         #           },
         #           // Either "assetId" or "expression" must be here
         #         }
-        for i, row in self._dataframe.iterrows():
-            manifest = row["manifest"]
+        for i, manifest in zip(self._dataframe.index, self._dataframe["manifest"]):
 
             # Main required keys
-            for key in ["fileFormat", "bandIds", "grid"]:
+            for key in ("fileFormat", "bandIds", "grid"):
                 if key not in manifest:
                     raise ValueError(
                         f"Missing key '{key}' in 'manifest' for row index {i}"
                     )
 
-            # At least one of 'assetId' or 'expression'
-            if not any(k in manifest for k in ["assetId", "expression"]):
+            # At least one of 'assetId' or 'expression' (two direct lookups, no generator per row)
+            if "assetId" not in manifest and "expression" not in manifest:
                 raise ValueError(
                     f"Manifest in row {i} does not contain 'assetId' or 'expression'"
                 )
 
             # Basic validation of 'grid'
             grid = manifest["grid"]
-            for subkey in ["dimensions", "affineTransform", "crsCode"]:
+            for subkey in ("dimensions", "affineTransform", "crsCode"):
                 if subkey not in grid:
                     raise ValueError(
                         f"Missing key '{subkey}' in 'manifest.grid' for row index {i}"
@@ -408,7 +580,7 @@ class RequestSet(BaseModel):
 
             # Basic validation of 'dimensions'
             dims = grid["dimensions"]
-            for dim_key in ["width", "height"]:
+            for dim_key in ("width", "height"):
                 if dim_key not in dims:
                     raise ValueError(
                         f"Missing '{dim_key}' in 'manifest.grid.dimensions' for row {i}"
@@ -421,7 +593,7 @@ class RequestSet(BaseModel):
 
             # Basic validation of 'affineTransform'
             aff = grid["affineTransform"]
-            for a_key in ["scaleX", "shearX", "translateX", "scaleY", "shearY", "translateY"]:
+            for a_key in ("scaleX", "shearX", "translateX", "scaleY", "shearY", "translateY"):
                 if a_key not in aff:
                     raise ValueError(
                         f"Missing '{a_key}' in 'manifest.grid.affineTransform' for row {i}"
@@ -440,23 +612,23 @@ class RequestSet(BaseModel):
         Validates that all entries have consistent and valid CRS formats.
 
         Returns:
-            RasterTransformSet: The validated instance.
+            RequestSet: The validated instance.
 
         Raises:
             ValueError: If any CRS is invalid or inconsistent.
         """
         # 1. Pre-consistency validation (CRS, IDs, etc.)
         crs_set: Set[str] = {meta.raster_transform.crs for meta in self.requestset}
-        validated_crs: Set[str] = set()
 
-        # Validate CRS formats
+        # Validate CRS formats, once per distinct CRS. WGS84 UTM zones (what
+        # `lonlat2rt` produces) are known to be valid and skip the PROJ lookup.
         for crs in crs_set:
-            if crs not in validated_crs:
-                try:
-                    CRS.from_string(crs)
-                    validated_crs.add(crs)
-                except Exception as e:
-                    raise ValueError(f"Invalid CRS format: {crs}") from e
+            if UTM_EPSG_PATTERN.fullmatch(crs):
+                continue
+            try:
+                CRS.from_string(crs)
+            except Exception as e:
+                raise ValueError(f"Invalid CRS format: {crs}") from e
 
         # Validate ids, they must be unique
         ids = {meta.id for meta in self.requestset}
@@ -474,15 +646,44 @@ class RequestSet(BaseModel):
     
 
 
+    def to_ndjson(self, path: str | pathlib.Path) -> pathlib.Path:
+        """
+        Writes the manifests to a newline-delimited JSON file, one request per line.
+
+        Each line is serialized and written on its own, so no JSON document for the whole
+        set is ever held in memory. ``orjson`` is used when installed.
+
+        Args:
+            path (Union[str, pathlib.Path]): Output file.
+
+        Returns:
+            pathlib.Path: The path of the written file.
+
+        Example:
+            >>> cube_requests.to_ndjson("manifests.ndjson")
+            PosixPath('manifests.ndjson')
+        """
+        path = pathlib.Path(path)
+        table = self._dataframe
+        with open(path, "wb") as dst:
+            for id_, outname, manifest in zip(
+                table["id"], table["outname"], table["manifest"]
+            ):
+                dst.write(
+                    dumps_json({"id": id_, "outname": outname, "manifest": manifest})
+                )
+                dst.write(b"\n")
+        return path
+
     def __repr__(self) -> str:
         """
         Provides a string representation of the metadata set including a table of all entries.
 
         Returns:
-            str: A string representation of the entire RasterTransformSet.
+            str: A string representation of the entire RequestSet.
         """
         num_entries = len(self.requestset)
-        return f"RasterTransformSet({num_entries} entries)"
+        return f"RequestSet({num_entries} entries)"
 
     def __str__(self):
         return super().__repr__()
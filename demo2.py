@@ -36,15 +36,13 @@ points = [
     (-77.5, -10.5)
 ]
 
-geotransforms = [
-    cubexpress.lonlat2rt(
-        lon=lon,
-        lat=lat,
-        edge_size=2560*2,
-        scale=10
-    )
-    for lon, lat in points
-]
+lon, lat = zip(*points)
+geotransforms = cubexpress.lonlat2rt_batch(
+    lon=lon,
+    lat=lat,
+    edge_size=2560*2,
+    scale=10
+)
 
 cube_requests = cubexpress.RequestSet(
     requestset=[
@@ -126,13 +124,15 @@ collection = (
     .filterDate("2024-01-01", "2024-01-31")
 )
 
+# Fetch the asset IDs of every point in a single getInfo round-trip
+image_ids_per_point = ee.List([
+    collection.filterBounds(ee.Geometry.Point([lon, lat])).aggregate_array('system:id')
+    for lon, lat in points
+]).getInfo()
+
 requestset = []
 
-for i, (lon, lat) in enumerate(points):
-    print(i)
-    point_geom = ee.Geometry.Point([lon, lat])
-    collection_filtered = collection.filterBounds(point_geom)
-    image_ids = collection_filtered.aggregate_array('system:id').getInfo()
+for i, ((lon, lat), image_ids) in enumerate(zip(points, image_ids_per_point)):
 
     geotransform = cubexpress.lonlat2rt(
         lon=lon,
@@ -259,15 +259,13 @@ points = [
     (-77.5, -10.5)
 ]
 
-geotransforms = [
-    cubexpress.lonlat2rt(
-        lon=lon,
-        lat=lat,
-        edge_size=2560*2,
-        scale=10
-    )
-    for lon, lat in points
-]
+lon, lat = zip(*points)
+geotransforms = cubexpress.lonlat2rt_batch(
+    lon=lon,
+    lat=lat,
+    edge_size=2560*2,
+    scale=10
+)
 
 cube_requests = cubexpress.RequestSet(
     requestset=[
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from pyproj import Transformer
+
+from cubexpress.conversion import geo2utm, geo2utm_batch, lonlat2epsg, lonlat2rt, lonlat2rt_batch
+
+
+def test_geo2utm_batch_matches_pyproj():
+    rng = np.random.default_rng(0)
+    lon = rng.uniform(-180, 180, 2000)
+    lat = rng.uniform(-80, 84, 2000)
+
+    # Include the zone edges and the Norway/Svalbard exceptions
+    lon = np.append(lon, [-180.0, 180.0, 0.0, 5.0, 8.0, 20.0, 32.0, 41.0])
+    lat = np.append(lat, [-80.0, 84.0, 0.0, 60.0, 75.0, 78.0, 80.0, 83.0])
+
+    x, y, crs = geo2utm_batch(lon, lat)
+
+    assert crs == [lonlat2epsg(lo, la) for lo, la in zip(lon, lat)]
+    for epsg in set(crs):
+        mask = np.array(crs) == epsg
+        ex, ey = Transformer.from_crs("EPSG:4326", epsg, always_xy=True).transform(
+            lon[mask], lat[mask]
+        )
+        np.testing.assert_allclose(x[mask], ex, rtol=0, atol=1e-5)
+        np.testing.assert_allclose(y[mask], ey, rtol=0, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    ("lon", "lat"),
+    [(0.0, 95.0), (0.0, 84.5), (0.0, -80.5), (400.0, 10.0), (-180.5, 0.0), (np.nan, 0.0)],
+)
+def test_out_of_range_coordinates_are_rejected(lon, lat):
+    with pytest.raises(ValueError):
+        geo2utm_batch([10.0, lon], [10.0, lat])
+    with pytest.raises(ValueError):
+        lonlat2rt_batch([lon], [lat], edge_size=128, scale=10)
+
+
+def test_geo2utm_matches_geo2utm_batch():
+    x, y, crs = geo2utm_batch([-76.0, 10.5, 8.0], [40.0, -33.2, 60.0])
+    for i, (lon, lat) in enumerate([(-76.0, 40.0), (10.5, -33.2), (8.0, 60.0)]):
+        assert geo2utm(lon, lat) == (x[i], y[i], crs[i])
+
+
+@pytest.mark.parametrize(
+    ("lon", "lat"),
+    [(0.0, 95.0), (0.0, 84.5), (0.0, -80.5), (400.0, 10.0), (-180.5, 0.0), (float("nan"), 0.0)],
+)
+def test_out_of_range_point_is_rejected(lon, lat):
+    with pytest.raises(ValueError):
+        lonlat2epsg(lon, lat)
+    with pytest.raises(ValueError):
+        lonlat2rt(lon, lat, edge_size=128, scale=10)
+
+
+@pytest.mark.parametrize("edge_size", [float("inf"), float("nan"), 0, -4, 12.5])
+def test_invalid_edge_size_is_rejected(edge_size):
+    with pytest.raises(ValueError):
+        lonlat2rt(-76.0, 40.0, edge_size=edge_size, scale=10)
+    with pytest.raises(ValueError):
+        lonlat2rt_batch([-76.0], [40.0], edge_size=edge_size, scale=10)
+
+
+def test_raster_batch_slicing():
+    rts = lonlat2rt_batch([-76.0, -75.5, 10.5, 8.0], [40.0, 40.5, -33.2, 60.0], edge_size=64, scale=10)
+
+    assert [rt.model_dump() for rt in rts[1:3]] == [rts[1].model_dump(), rts[2].model_dump()]
+    assert rts[::-1][0].model_dump() == rts[-1].model_dump()
+    assert rts[np.int64(2)].model_dump() == rts[2].model_dump()
+    with pytest.raises(TypeError):
+        rts[[0, 1]]